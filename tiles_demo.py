@@ -3,17 +3,20 @@ tiles_demo.py — Мини-проект по XYZ-тайлам (Web Mercator).
 Функции:
 - Перевод (lat, lon, zoom) → tile (x, y) и пиксели внутри тайла.
 - Рендер сетки тайлов NxN вокруг точки для нескольких zoom.
-- Сохранение PNG с подписями X/Y и координат.
+- Сохранение PNG (или BMP) с подписями X/Y и координат.
 
-Зависимости: Pillow (PIL) — установи:  pip install pillow
+Зависимости: Pillow (PIL) и NumPy — установи:  pip install pillow numpy
 
 Пример запуска:
     python tiles_demo.py --lat 53.1959 --lon 50.1008 --zooms 12 13 14 --grid 3 --out ./out
 """
 import argparse
+import functools
+import io
 import math
 import os
-from typing import Tuple, List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional, Tuple, List
 
 try:
     from PIL import Image, ImageDraw, ImageFont
@@ -24,10 +27,31 @@ except Exception as e:
         f"Подробности: {e}"
     )
 
+try:
+    import numpy as np
+except Exception as e:
+    raise SystemExit(
+        "Ошибка: не удалось импортировать NumPy. "
+        "Установите библиотеку командой: pip install numpy\n"
+        f"Подробности: {e}"
+    )
+
 # ---------- Гео <-> Тайлы  ----------
+LAT_MAX = 85.05112878  # предел широты Web Mercator, atan(sinh(π)) в градусах
+# Обратные константы: в горячих формулах умножение вместо деления
+INV_PI = 1.0 / math.pi
+INV_360 = 1.0 / 360.0
+
 def clamp_lat(lat: float) -> float:
     """Ограничить широту допустимым диапазоном Web Mercator (~±85.0511°)."""
-    return max(min(lat, 85.05112878), -85.05112878)
+    return LAT_MAX if lat > LAT_MAX else (-LAT_MAX if lat < -LAT_MAX else lat)
+
+def _check_lon_z(lon: float, z: int) -> None:
+    """Проверка долготы и уровня масштабирования."""
+    if not (-180.0 <= lon <= 180.0):
+        raise ValueError("Долгота должна быть в диапазоне [-180, 180].")
+    if not (0 <= z <= 22):
+        raise ValueError("Уровень масштабирования z должен быть в диапазоне [0, 22].")
 
 def latlon_to_tile(lat: float, lon: float, z: int, tile_size: int = 256) -> Tuple[int, int, int, int]:
     """
@@ -35,48 +59,120 @@ def latlon_to_tile(lat: float, lon: float, z: int, tile_size: int = 256) -> Tupl
     и возвращает также пиксельные координаты внутри тайла (px, py).
     Схема XYZ/Web Mercator (EPSG:3857).
     """
-    lat = clamp_lat(lat)
-    if not (-180.0 <= lon <= 180.0):
-        raise ValueError("Долгота должна быть в диапазоне [-180, 180].")
+    _check_lon_z(lon, z)
+    return make_projector(z, tile_size)(lat, lon)
+
+def _latlon_to_tile_unchecked(lat: float, lon: float, z: int, tile_size: int) -> Tuple[int, int, int, int]:
+    """
+    latlon_to_tile без проверки lon — для внутренних вызовов с уже проверенными аргументами.
+    z по-прежнему проверяется в make_projector при построении (не кэшированной) проекции.
+    """
+    return make_projector(z, tile_size)(lat, lon)
+
+@functools.lru_cache(maxsize=64)
+def make_projector(z: int, tile_size: int = 256) -> Callable[[float, float], Tuple[int, int, int, int]]:
+    """
+    Проекция (lat, lon) → (x, y, px, py), специализированная для фиксированных z и tile_size:
+    константы считаются один раз, функции math привязаны к замыканию. Единственная
+    скалярная реализация формул; кэшируется по (z, tile_size). Долгота не проверяется.
+    """
     if not (0 <= z <= 22):
         raise ValueError("Уровень масштабирования z должен быть в диапазоне [0, 22].")
 
-    n = 2 ** z
-    lat_rad = math.radians(lat)
+    n = 1 << z
+    n_ts = n * tile_size
+    n_max = n - 1
+    # Для тайлов размером 2^k остаток от деления — это просто битовая маска
+    mask = tile_size - 1 if tile_size & (tile_size - 1) == 0 else None
+    lat_max = LAT_MAX
+    inv_pi, inv_360 = INV_PI, INV_360
+    asinh, tan, radians, floor = math.asinh, math.tan, math.radians, math.floor
 
-    x_norm = (lon + 180.0) / 360.0
-    y_norm = (1.0 - math.log(math.tan(lat_rad) + (1 / math.cos(lat_rad))) / math.pi) / 2.0
+    def proj(lat: float, lon: float) -> Tuple[int, int, int, int]:
+        # clamp_lat встроен, чтобы не платить за вызов функции на каждой точке
+        lat = lat_max if lat > lat_max else (-lat_max if lat < -lat_max else lat)
+        lat_rad = radians(lat)
+        x_norm = (lon + 180.0) * inv_360
+        y_norm = (1.0 - asinh(tan(lat_rad)) * inv_pi) * 0.5
+        x_tile = int(floor(x_norm * n))
+        y_tile = int(floor(y_norm * n))
+        if mask is not None:
+            px_in_tile = int(x_norm * n_ts) & mask
+            py_in_tile = int(y_norm * n_ts) & mask
+        else:
+            px_in_tile = int(x_norm * n_ts) % tile_size
+            py_in_tile = int(y_norm * n_ts) % tile_size
+        x_tile = 0 if x_tile < 0 else (n_max if x_tile > n_max else x_tile)
+        y_tile = 0 if y_tile < 0 else (n_max if y_tile > n_max else y_tile)
+        return x_tile, y_tile, px_in_tile, py_in_tile
 
-    x_tile = int(math.floor(x_norm * n))
-    y_tile = int(math.floor(y_norm * n))
+    return proj
 
-    x_px_total = x_norm * n * tile_size
-    y_px_total = y_norm * n * tile_size
+def latlon_to_tile_batch(
+    lats: np.ndarray, lons: np.ndarray, z: int, tile_size: int = 256
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Векторная версия latlon_to_tile: переводит массивы lat/lon в массивы
+    (x, y, px, py) за один проход NumPy, без Python-цикла по точкам.
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    # Сравнения с NaN ложны, поэтому проверяем попадание в диапазон, а не выход из него
+    if not np.all((lons >= -180.0) & (lons <= 180.0)):
+        raise ValueError("Долгота должна быть в диапазоне [-180, 180].")
+    if np.any(np.isnan(lats)):
+        raise ValueError("Широта не должна быть NaN.")
+    if not (0 <= z <= 22):
+        raise ValueError("Уровень масштабирования z должен быть в диапазоне [0, 22].")
 
-    px_in_tile = int(x_px_total) % tile_size
-    py_in_tile = int(y_px_total) % tile_size
+    n = 1 << z
+    n_ts = n * tile_size
+    lat_rad = np.radians(np.clip(lats, -LAT_MAX, LAT_MAX))
 
-    x_tile = max(0, min(x_tile, n - 1))
-    y_tile = max(0, min(y_tile, n - 1))
+    x_norm = (lons + 180.0) * INV_360
+    y_norm = (1.0 - np.arcsinh(np.tan(lat_rad)) * INV_PI) * 0.5
+
+    # Все четыре массива — int64: при z=22 и больших тайлах пиксели не влезают в int32
+    x_tile = np.clip(np.floor(x_norm * n), 0, n - 1).astype(np.int64)
+    y_tile = np.clip(np.floor(y_norm * n), 0, n - 1).astype(np.int64)
+
+    px_total = (x_norm * n_ts).astype(np.int64)
+    py_total = (y_norm * n_ts).astype(np.int64)
+    if tile_size & (tile_size - 1) == 0:
+        px_in_tile = px_total & (tile_size - 1)
+        py_in_tile = py_total & (tile_size - 1)
+    else:
+        px_in_tile = px_total % tile_size
+        py_in_tile = py_total % tile_size
     return x_tile, y_tile, px_in_tile, py_in_tile
 
 def tile_to_bounds(x: int, y: int, z: int) -> Tuple[float, float, float, float]:
     """Границы тайла (lon_min, lat_min, lon_max, lat_max)."""
-    n = 2 ** z
-    def lon_deg(tx: int) -> float:
-        return tx / n * 360.0 - 180.0
-    def lat_deg(ty: int) -> float:
-        yv = math.pi * (1 - 2 * ty / n)
-        return math.degrees(math.atan(math.sinh(yv)))
-    lon_min = lon_deg(x)
-    lon_max = lon_deg(x + 1)
-    lat_min = lat_deg(y + 1)
-    lat_max = lat_deg(y)
+    inv_n = 1.0 / (1 << z)  # n — степень двойки, поэтому 1/n точное
+    lon_min = x * inv_n * 360.0 - 180.0
+    lon_max = (x + 1) * inv_n * 360.0 - 180.0
+    lat_min = math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * (y + 1) * inv_n))))
+    lat_max = math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * y * inv_n))))
+    return lon_min, lat_min, lon_max, lat_max
+
+def tile_to_bounds_batch(
+    xs: np.ndarray, ys: np.ndarray, z: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Векторная версия tile_to_bounds: массивы (lon_min, lat_min, lon_max, lat_max)."""
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    inv_n = 1.0 / (1 << z)
+
+    lon_min = xs * inv_n * 360.0 - 180.0
+    lon_max = lon_min + inv_n * 360.0
+    lat_min = np.degrees(np.arctan(np.sinh(np.pi * (1.0 - 2.0 * (ys + 1.0) * inv_n))))
+    lat_max = np.degrees(np.arctan(np.sinh(np.pi * (1.0 - 2.0 * ys * inv_n))))
     return lon_min, lat_min, lon_max, lat_max
 
 # ---------- Рендер ----------
+@functools.lru_cache(maxsize=8)
 def try_load_font(size: int = 14) -> ImageFont.FreeTypeFont:
-    """Пытается загрузить системный шрифт; при неудаче — встроенный."""
+    """Пытается загрузить системный шрифт; при неудаче — встроенный. Результат кэшируется по size."""
     candidates = [
         "/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf",
         "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
@@ -91,44 +187,38 @@ def try_load_font(size: int = 14) -> ImageFont.FreeTypeFont:
                 pass
     return ImageFont.load_default()
 
-def draw_grid(lat: float, lon: float, z: int, grid: int = 3, tile_size: int = 256) -> Image.Image:
+@functools.lru_cache(maxsize=8)
+def _line_step(font_size: int) -> int:
+    """Шаг между строками подписи — как у multiline_text при spacing=4."""
+    return try_load_font(font_size).getbbox("A")[3] + 4
+
+@functools.lru_cache(maxsize=512)
+def _text_mask(text: str, font_size: int) -> Tuple[Any, int, int]:
     """
-    Рисует сетку grid×grid тайлов с центрированием на тайле, где находится точка (lat, lon).
-    Центр сетки — тайл с точкой; точка отмечается маркером.
+    Сглаженная маска глифов строки и её смещение от точки привязки.
+    Кэшируется по строке: одинаковые строки (например, «Z=14» во всех тайлах) набираются один раз.
     """
-    if grid % 2 == 0 or grid < 1:
-        raise ValueError("grid должен быть нечётным положительным числом, например 3 или 5.")
+    font = try_load_font(font_size)
+    if hasattr(font, "getmask2"):
+        mask, (ox, oy) = font.getmask2(text, "L")
+    else:
+        mask, ox, oy = font.getmask(text, "L"), 0, 0
+    return mask, ox, oy
 
-    x_c, y_c, px, py = latlon_to_tile(lat, lon, z, tile_size=tile_size)
-    half = grid // 2
+def _paste_tile_label(img: Image.Image, x: int, y: int, xt: int, yt: int, z: int, font_size: int = 14) -> None:
+    """Подпись тайла «X=.. Y=..» / «Z=..» в точке (x, y): готовые маски строк вклеиваются чёрным."""
+    for text, ty in ((f"X={xt}  Y={yt}", y), (f"Z={z}", y + _line_step(font_size))):
+        mask, ox, oy = _text_mask(text, font_size)
+        left, top = x + ox, ty + oy
+        img.im.paste((0, 0, 0), (left, top, left + mask.size[0], top + mask.size[1]), mask)
 
-    width = grid * tile_size
-    height = grid * tile_size
-    img = Image.new("RGB", (width, height), (255, 255, 255))
-    draw = ImageDraw.Draw(img)
-    font = try_load_font(14)
-    font_big = try_load_font(18)
-
-    # Линии сетки
-    for i in range(grid + 1):
-        x = i * tile_size
-        draw.line([(x, 0), (x, height)], fill=(0, 0, 0), width=1)
-        y = i * tile_size
-        draw.line([(0, y), (width, y)], fill=(0, 0, 0), width=1)
-
-    # Подписи тайлов X/Y
-    for gy in range(grid):
-        for gx in range(grid):
-            xt = x_c + (gx - half)
-            yt = y_c + (gy - half)
-            text = f"X={xt}  Y={yt}\nZ={z}"
-            tx = gx * tile_size + 6
-            ty = gy * tile_size + 6
-            draw.text((tx, ty), text, fill=(0, 0, 0), font=font)
-
-    # Маркер точки в центральном тайле
-    cx = half * tile_size + px
-    cy = half * tile_size + py
+def _draw_marker_and_header(
+    draw: ImageDraw.ImageDraw, lat: float, lon: float, z: int,
+    x_c: int, y_c: int, px: int, py: int, origin: int, tile_size: int, height: int,
+) -> None:
+    """Маркер точки (origin — левый верхний угол центрального тайла) и подпись внизу."""
+    cx = origin + px
+    cy = origin + py
     r = 4
     draw.ellipse((cx - r, cy - r, cx + r, cy + r), fill=(220, 0, 0), outline=(0, 0, 0))
 
@@ -136,20 +226,163 @@ def draw_grid(lat: float, lon: float, z: int, grid: int = 3, tile_size: int = 25
         f"Point: lat={lat:.6f}, lon={lon:.6f} | Z={z}\n"
         f"Center tile: X={x_c}, Y={y_c} | px={px}, py={py} (tile_size={tile_size})"
     )
-    draw.text((10, height - 40), header, fill=(0, 0, 0), font=font_big)
+    draw.text((10, height - 40), header, fill=(0, 0, 0), font=try_load_font(18))
+
+def _grid_template(grid: int, tile_size: int) -> Image.Image:
+    """
+    Пустая сетка: белый холст и линии тайлов — заливкой и двумя срезами
+    с шагом tile_size в NumPy; правая/нижняя линии лежат за краем и не видны.
+    """
+    size = grid * tile_size
+    arr = np.full((size, size, 3), 255, dtype=np.uint8)
+    arr[::tile_size, :] = 0
+    arr[:, ::tile_size] = 0
+    return Image.fromarray(arr)
+
+def _new_canvas(grid: int, tile_size: int) -> Tuple[Image.Image, ImageDraw.ImageDraw, Image.Image]:
+    """
+    Холст, его ImageDraw и пустая сетка-шаблон для переиспользования между zoom
+    одного вызова render_zooms: перед каждым zoom холст сбрасывается копированием шаблона.
+    """
+    template = _grid_template(grid, tile_size)
+    img = template.copy()
+    return img, ImageDraw.Draw(img), template
+
+def _check_grid(grid: int) -> None:
+    """Проверка размера сетки: нечётное положительное число."""
+    if grid % 2 == 0 or grid < 1:
+        raise ValueError("grid должен быть нечётным положительным числом, например 3 или 5.")
+
+def _compute_grid_tile_indices(
+    lat: float, lon: float, z: int, grid: int, tile_size: int
+) -> Tuple[range, range, int, int]:
+    """
+    Индексы тайлов по столбцам и строкам сетки grid×grid вокруг точки
+    и пиксели точки в центральном тайле: (x_indices, y_indices, px, py).
+    """
+    x_c, y_c, px, py = _latlon_to_tile_unchecked(lat, lon, z, tile_size)
+    half = grid // 2
+    return range(x_c - half, x_c + half + 1), range(y_c - half, y_c + half + 1), px, py
+
+def _draw_grid_inplace(
+    img: Image.Image, draw: ImageDraw.ImageDraw, lat: float, lon: float, z: int, grid: int, tile_size: int
+) -> Tuple[int, int, int, int]:
+    """
+    Рисует подписи, маркер и заголовок на холсте img с уже нарисованной пустой сеткой.
+    Возвращает центральный тайл и пиксели точки в нём (x, y, px, py).
+    Аргументы должны быть уже проверены (_check_grid, _check_lon_z).
+    """
+    half = grid // 2
+    xs, ys, px, py = _compute_grid_tile_indices(lat, lon, z, grid, tile_size)
+    x_c, y_c = xs[half], ys[half]
+
+    # Подписи тайлов X/Y из кэшированных масок строк, отступы считаются заранее
+    offsets = range(6, grid * tile_size, tile_size)
+    for ty, yt in zip(offsets, ys):
+        for tx, xt in zip(offsets, xs):
+            _paste_tile_label(img, tx, ty, xt, yt, z)
+
+    # Маркер точки в центральном тайле и подпись внизу
+    _draw_marker_and_header(draw, lat, lon, z, x_c, y_c, px, py, half * tile_size, tile_size, grid * tile_size)
+    return x_c, y_c, px, py
+
+def draw_grid(lat: float, lon: float, z: int, grid: int = 3, tile_size: int = 256) -> Image.Image:
+    """
+    Рисует сетку grid×grid тайлов с центрированием на тайле, где находится точка (lat, lon).
+    Центр сетки — тайл с точкой; точка отмечается маркером.
+    """
+    _check_grid(grid)
+    _check_lon_z(lon, z)
+    img = _grid_template(grid, tile_size)
+    _draw_grid_inplace(img, ImageDraw.Draw(img), lat, lon, z, grid, tile_size)
     return img
 
-def render_zooms(lat: float, lon: float, zooms: List[int], grid: int, tile_size: int, out_dir: str) -> None:
+def _check_fmt(fmt: str) -> None:
+    """Проверка формата вывода: png или bmp."""
+    if fmt not in ("png", "bmp"):
+        raise ValueError("Формат изображения должен быть png или bmp.")
+
+def encode_image(img: Image.Image, fmt: str = "png", png_level: int = 1) -> bytes:
+    """
+    Кодирует изображение в память (PNG или BMP).
+    BMP пишется без сжатия — удобно для быстрых отладочных прогонов.
+    """
+    _check_fmt(fmt)
+    buf = io.BytesIO()
+    if fmt == "bmp":
+        img.save(buf, format="BMP")
+    else:
+        # Картинки почти однотонные: быстрый deflate почти не увеличивает размер
+        img.save(buf, format="PNG", compress_level=png_level)
+    return buf.getvalue()
+
+def _write_file(out_path: str, data: bytes) -> None:
+    """Записывает готовые байты одним вызовом через буфер 1 МиБ."""
+    with open(out_path, "wb", buffering=1 << 20) as f:
+        f.write(data)
+
+def save_image(img: Image.Image, out_path: str, fmt: str = "png", png_level: int = 1) -> None:
+    """Кодирует изображение в память и записывает файл одним буферизованным вызовом."""
+    _write_file(out_path, encode_image(img, fmt=fmt, png_level=png_level))
+
+# Порог суммарного числа пикселей всех zoom, с которого окупается пул процессов:
+# рендер+кодирование ~16 нс/пиксель, т.е. порог ≈ 1 с последовательной работы
+PARALLEL_MIN_PIXELS = 64 * 1024 * 1024
+
+def _render_zoom(
+    z: int, lat: float, lon: float, grid: int, tile_size: int, out_dir: str,
+    png_level: int, fmt: str,
+    canvas: Optional[Tuple[Image.Image, ImageDraw.ImageDraw, Image.Image]] = None,
+) -> str:
+    """
+    Рендер и сохранение одного уровня z; возвращает строку отчёта для печати.
+    canvas — холст из _new_canvas, общий для zoom одного вызова; без него создаётся свой.
+    """
+    try:
+        _check_lon_z(lon, z)
+        if canvas is None:
+            img = _grid_template(grid, tile_size)
+            draw = ImageDraw.Draw(img)
+        else:
+            img, draw, template = canvas
+            img.paste(template)
+        x, y, px, py = _draw_grid_inplace(img, draw, lat, lon, z, grid, tile_size)
+        out_path = os.path.join(out_dir, f"grid_z{z}.{fmt}")
+        save_image(img, out_path, fmt=fmt, png_level=png_level)
+        return f"[OK] Z={z}: сохранено {out_path} | tile=({x},{y}) px=({px},{py})"
+    except Exception as e:
+        return f"[ERROR] Не удалось построить изображение для Z={z}: {e}"
+
+def render_zooms(
+    lat: float, lon: float, zooms: List[int], grid: int, tile_size: int, out_dir: str,
+    png_level: int = 1, fmt: str = "png",
+) -> None:
+    """
+    Рендерит сетки для всех zooms. Уровни независимы, поэтому при достаточно большом
+    объёме работы они считаются параллельно в отдельных процессах; каждый файл
+    пишется сразу после рендера, отчёт печатается в исходном порядке.
+    """
+    _check_fmt(fmt)
+    _check_grid(grid)
     os.makedirs(out_dir, exist_ok=True)
-    for z in zooms:
-        try:
-            img = draw_grid(lat, lon, z, grid=grid, tile_size=tile_size)
-            out_path = os.path.join(out_dir, f"grid_z{z}.png")
-            img.save(out_path, format="PNG")
-            x, y, px, py = latlon_to_tile(lat, lon, z, tile_size=tile_size)
-            print(f"[OK] Z={z}: сохранено {out_path} | tile=({x},{y}) px=({px},{py})")
-        except Exception as e:
-            print(f"[ERROR] Не удалось построить изображение для Z={z}: {e}")
+    render = functools.partial(
+        _render_zoom, lat=lat, lon=lon, grid=grid, tile_size=tile_size,
+        out_dir=out_dir, png_level=png_level, fmt=fmt,
+    )
+    workers = min(len(zooms), os.cpu_count() or 1)
+    # Запуск пула (особенно spawn на Windows/macOS) стоит сотни миллисекунд —
+    # мелкие прогоны быстрее отрисовать в текущем процессе
+    if len(zooms) * grid * grid * tile_size * tile_size < PARALLEL_MIN_PIXELS:
+        workers = 1
+    if workers <= 1:
+        # Один холст на весь прогон; освобождается вместе с локальными переменными
+        canvas = _new_canvas(grid, tile_size)
+        for z in zooms:
+            print(render(z, canvas=canvas))
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for line in pool.map(render, zooms):
+            print(line)
 
 # ---------- CLI ----------
 def build_arg_parser() -> argparse.ArgumentParser:
@@ -168,6 +401,10 @@ def build_arg_parser() -> argparse.ArgumentParser:
     p.add_argument("--grid", type=int, default=3, help="Размер сетки (нечётное число). По умолчанию 3.")
     p.add_argument("--tile-size", type=int, default=256, help="Размер тайла в пикселях. По умолчанию 256.")
     p.add_argument("--out", type=str, default="./out", help="Папка для сохранения изображений.")
+    p.add_argument("--png-level", type=int, default=1,
+                   help="Уровень сжатия PNG (0..9). По умолчанию 1 — быстро и почти без потери в размере.")
+    p.add_argument("--format", type=str, choices=["png", "bmp"], default="png",
+                   help="Формат изображений: png или bmp (без сжатия, быстрее). По умолчанию png.")
     return p
 
 def main():
@@ -187,6 +424,8 @@ def main():
         for z in args.zooms:
             if z < 0 or z > 22:
                 raise ValueError("Элемент в --zooms должен быть в диапазоне [0..22].")
+        if not (0 <= args.png_level <= 9):
+            raise ValueError("Аргумент --png-level должен быть в диапазоне [0..9].")
     except Exception as e:
         print(f"[ERROR] Некорректные аргументы: {e}")
         return
@@ -198,7 +437,9 @@ def main():
             zooms=args.zooms,
             grid=args.grid,
             tile_size=args.tile_size,
-            out_dir=args.out
+            out_dir=args.out,
+            png_level=args.png_level,
+            fmt=args.format
         )
     except Exception as e:
         print(f"[ERROR] Во время рендера произошла ошибка: {e}")